@@ -401,6 +401,6 @@ class Command(NoArgsCommand):
                     print >>sys.stderr, "Examples data '%s' not found, no examples will be generated" % EXAMPLES_FILE
 
                 introspector.write_docs(examples)
-            except:
+            except Exception:
                 print >>sys.stderr, traceback.format_exc()
                 raise
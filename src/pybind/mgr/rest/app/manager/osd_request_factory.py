@@ -1,5 +1,5 @@
 from rest.app.manager.request_factory import RequestFactory
-from rest.app.types import OsdMap, OSD_IMPLEMENTED_COMMANDS, OSD_FLAGS
+from rest.app.types import OsdMap, OSD_IMPLEMENTED_COMMANDS, OSD_FLAGS_SET
 from rest.app.manager.user_request import OsdMapModifyingRequest, RadosRequest
 
 from rest.module import global_instance as rest_plugin
@@ -39,13 +39,15 @@ class OsdRequestFactory(RequestFactory):
         msg_attrs = attributes.copy()
         del msg_attrs['id']
 
-        if msg_attrs.keys() == ['in']:
+        # Use a specific message when exactly one attribute is changing
+        only_attr = next(iter(msg_attrs)) if len(msg_attrs) == 1 else None
+        if only_attr == 'in':
             message = "Marking osd.{id} {state}".format(
                 id=osd_id, state=("in" if msg_attrs['in'] else "out"))
-        elif msg_attrs.keys() == ['up']:
+        elif only_attr == 'up':
             message = "Marking osd.{id} down".format(
                 id=osd_id)
-        elif msg_attrs.keys() == ['reweight']:
+        elif only_attr == 'reweight':
             message = "Re-weighting osd.{id} to {pct}%".format(
                 id=osd_id, pct="{0:.1f}".format(msg_attrs['reweight'] * 100.0))
         else:
@@ -87,9 +89,9 @@ class OsdRequestFactory(RequestFactory):
     def _commands_to_set_flags(self, osd_map, attributes):
         commands = []
 
-        flags_not_implemented = set(attributes.keys()) - set(OSD_FLAGS)
+        flags_not_implemented = [k for k in attributes if k not in OSD_FLAGS_SET]
         if flags_not_implemented:
-            raise RuntimeError("%s not valid to set/unset" % list(flags_not_implemented))
+            raise RuntimeError("%s not valid to set/unset" % flags_not_implemented)
 
         flags_to_set = set(k for k, v in attributes.iteritems() if v)
         flags_to_unset = set(k for k, v in attributes.iteritems() if not v)
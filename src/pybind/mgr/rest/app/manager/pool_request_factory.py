@@ -13,6 +13,11 @@ log = logger()
 POOL_PROPERTIES = ["size", "min_size", "crash_replay_interval", "pg_num",
                    "pgp_num", "crush_ruleset", "hashpspool"]
 
+# Pool attributes set with 'ceph osd pool set-quota', mapped to the
+# 'field' argument for that command
+POOL_QUOTA_PROPERTIES = [('quota_max_bytes', 'max_bytes'),
+                         ('quota_max_objects', 'max_objects')]
+
 # In Ceph versions before mon_osd_max_split_count, assume it is set to this
 LEGACY_MON_OSD_MAX_SPLIT_COUNT = "32"
 
@@ -42,8 +47,7 @@ class PoolRequestFactory(RequestFactory):
 
         # Quota setting ('osd pool set-quota') is separate to the main 'set'
         # operation
-        for attr_name, set_name in [('quota_max_bytes', 'max_bytes'),
-                                    ('quota_max_objects', 'max_objects')]:
+        for attr_name, set_name in POOL_QUOTA_PROPERTIES:
             if attr_name in attributes:
                 commands.append(('osd pool set-quota', {
                     'pool': pool_name,
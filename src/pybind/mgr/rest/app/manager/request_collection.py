@@ -1,4 +1,5 @@
 
+from contextlib import contextmanager
 from threading import RLock
 from rest.app.manager.user_request import UserRequest
 from rest.logger import logger
@@ -28,6 +29,10 @@ class RequestCollection(object):
         super(RequestCollection, self).__init__()
 
         self._by_request_id = {}
+        # Requests which are still in flight: map and command notifications
+        # only care about these, so keep them apart from the (ever growing)
+        # history of completed requests.
+        self._submitted = {}
         self._lock = RLock()
 
     def get_by_id(self, request_id):
@@ -36,9 +41,23 @@ class RequestCollection(object):
     def get_all(self, state=None):
         if not state:
             return self._by_request_id.values()
+        elif state == UserRequest.SUBMITTED:
+            return list(self._submitted.values())
         else:
             return [r for r in self._by_request_id.values() if r.state == state]
 
+    @contextmanager
+    def _update_index(self, request):
+        """
+        Wrap operations which may progress a request, so that it is
+        dropped from the in-flight index once it completes.
+        """
+        try:
+            yield
+        finally:
+            if request.state == UserRequest.COMPLETE:
+                self._submitted.pop(request.id, None)
+
     # def tick(self):
     #     """
     #     For walltime-based monitoring of running requests.  Long-running requests
@@ -149,6 +168,7 @@ class RequestCollection(object):
                 request.id, request.headline))
             self._by_request_id[request.id] = request
             request.submit()
+            self._submitted[request.id] = request
 
     def on_map(self, sync_type, sync_object):
         """
@@ -157,20 +177,19 @@ class RequestCollection(object):
         so that they can progress if they were waiting for it.
         """
         with self._lock:
-            log.info("RequestCollection.on_map: {0}".format(sync_type))
+            log.debug("RequestCollection.on_map: %s", sync_type)
             requests = self.get_all(state=UserRequest.SUBMITTED)
             for request in requests:
-                try:
-                    # If this is one of the types that this request
-                    # is waiting for, invoke on_map.
-                    for awaited_type in request.awaiting_versions.keys():
-                        if awaited_type == sync_type:
+                with self._update_index(request):
+                    try:
+                        # If this is one of the types that this request
+                        # is waiting for, invoke on_map.
+                        if sync_type in request.awaiting_versions:
                             request.on_map(sync_type, sync_object)
-                except Exception as e:
-                    log.error("e.__class__ = {0}".format(e.__class__))
-                    log.exception("Request %s threw exception in on_map", request.id)
-                    request.set_error("Internal error %s" % e)
-                    request.complete()
+                    except Exception as e:
+                        log.exception("Request %s threw exception in on_map", request.id)
+                        request.set_error("Internal error %s" % e)
+                        request.complete()
     #
     # def _on_rados_completion(self, request, result):
     #     """
@@ -229,31 +248,32 @@ class RequestCollection(object):
         completion so that it can progress.
         """
         with self._lock:
-            log.info("RequestCollection.on_completion: {0}".format(tag))
+            log.debug("RequestCollection.on_completion: %s", tag)
 
             try:
-                request = self.get_by_id(tag)
+                request = self._submitted[tag]
             except KeyError:
-                log.warning("on_completion: unknown tag {0}" % tag)
+                log.warning("on_completion: unknown tag {0}".format(tag))
                 return
 
-            request.rados_commands.advance()
-            if request.rados_commands.is_complete():
-                if request.rados_commands.r == 0:
-                    try:
-                        request.complete_jid()
-                    except Exception as e:
-                        log.exception("Request %s threw exception in on_map", request.id)
-                        request.set_error("Internal error %s" % e)
-                        request.complete()
+            with self._update_index(request):
+                request.rados_commands.advance()
+                if request.rados_commands.is_complete():
+                    if request.rados_commands.r == 0:
+                        try:
+                            request.complete_jid()
+                        except Exception as e:
+                            log.exception("Request %s threw exception in on_map", request.id)
+                            request.set_error("Internal error %s" % e)
+                            request.complete()
 
-                    # The request may be waiting for an epoch that we already have, if so
-                    # give it to the request right away
-                    for sync_type, want_version in request.awaiting_versions.items():
-                        sync_object = rest_plugin().get_sync_object(sync_type)
-                        if want_version and sync_type.cmp(sync_object.version, want_version) >= 0:
-                            log.info("Awaited %s %s is immediately available" % (sync_type, want_version))
-                            request.on_map(sync_type, sync_object)
-                else:
-                    request.set_error(request.rados_commands.outs)
-                    request.complete()
+                        # The request may be waiting for an epoch that we already have, if so
+                        # give it to the request right away
+                        for sync_type, want_version in request.awaiting_versions.items():
+                            sync_object = rest_plugin().get_sync_object(sync_type)
+                            if want_version and sync_type.cmp(sync_object.version, want_version) >= 0:
+                                log.info("Awaited %s %s is immediately available" % (sync_type, want_version))
+                                request.on_map(sync_type, sync_object)
+                    else:
+                        request.set_error(request.rados_commands.outs)
+                        request.complete()
@@ -1,3 +1,4 @@
+from collections import deque
 import json
 import logging
 import uuid
@@ -169,25 +170,24 @@ class RadosCommands(object):
     def __init__(self, tag, commands):
         self.result = None
         self._tag = tag
-        self._commands = commands
+        self._commands = deque(commands)
 
         self.r = None
         self.outs = None
         self.outb = None
 
     def run(self):
-        cmd = self._commands[0]
-        self._commands = self._commands[1:]
+        cmd = self._commands.popleft()
         self.result = CommandResult(self._tag)
 
-        log.debug("cmd={0}".format(cmd))
+        log.debug("cmd=%s", cmd)
 
         # Commands come in as 2-tuple of args and prefix, convert them
         # to the form that send_command uses
         command = cmd[1]
         command['prefix'] = cmd[0]
 
-        rest_plugin().send_command(self.result, json.dumps(command), self._tag)
+        rest_plugin().send_command(self.result, json.dumps(command, separators=(',', ':')), self._tag)
 
     def is_complete(self):
         return self.result is None and not self._commands
@@ -201,7 +201,7 @@ class RadosCommands(object):
                 self.run()
         else:
             # Stop on errors
-            self._commands = []
+            self._commands.clear()
 
 
 class RadosRequest(UserRequest):
@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from rest.app.util import memoize
 
 from rest.logger import logger
@@ -61,13 +61,13 @@ class OsdMap(VersionedSyncObject):
     def __init__(self, version, data):
         super(OsdMap, self).__init__(version, data)
         if data is not None:
-            self.osds_by_id = dict([(o['osd'], o) for o in data['osds']])
-            self.pools_by_id = dict([(p['pool'], p) for p in data['pools']])
-            self.osd_tree_node_by_id = dict([(o['id'], o) for o in data['tree']['nodes'] if o['id'] >= 0])
+            self.osds_by_id = {o['osd']: o for o in data['osds']}
+            self.pools_by_id = {p['pool']: p for p in data['pools']}
+            self.osd_tree_node_by_id = {o['id']: o for o in data['tree']['nodes'] if o['id'] >= 0}
 
             # Special case Yuck
             flags = data.get('flags', '').replace('pauserd,pausewr', 'pause')
-            tokenized_flags = flags.split(',')
+            tokenized_flags = set(flags.split(','))
 
             self.flags = dict([(x, x in tokenized_flags) for x in OSD_FLAGS])
         else:
@@ -87,27 +87,37 @@ class OsdMap(VersionedSyncObject):
     def _get_crush_rule_osds(self, rule):
         nodes_by_id = self.get_tree_nodes_by_id()
 
+        # These walk the tree with an explicit stack rather than recursing,
+        # so that deep CRUSH hierarchies don't cost a frame and a
+        # temporary set per bucket.
         def _gather_leaf_ids(node):
-            if node['id'] >= 0:
-                return set([node['id']])
-
             result = set()
-            for child_id in node['children']:
-                if child_id >= 0:
-                    result.add(child_id)
-                else:
-                    result |= _gather_leaf_ids(nodes_by_id[child_id])
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                if node['id'] >= 0:
+                    result.add(node['id'])
+                    continue
+
+                for child_id in node['children']:
+                    if child_id >= 0:
+                        result.add(child_id)
+                    else:
+                        stack.append(nodes_by_id[child_id])
 
             return result
 
         def _gather_descendent_ids(node, typ):
             result = set()
-            for child_id in node['children']:
-                child_node = nodes_by_id[child_id]
-                if child_node['type'] == typ:
-                    result.add(child_node['id'])
-                elif 'children' in child_node:
-                    result |= _gather_descendent_ids(child_node, typ)
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                for child_id in node['children']:
+                    child_node = nodes_by_id[child_id]
+                    if child_node['type'] == typ:
+                        result.add(child_node['id'])
+                    elif 'children' in child_node:
+                        stack.append(child_node)
 
             return result
 
@@ -160,10 +170,14 @@ class OsdMap(VersionedSyncObject):
         :return dict of pool ID to OSD IDs in the pool
         """
 
+        rules_by_ruleset = defaultdict(list)
+        for rule in self.data['crush']['rules']:
+            rules_by_ruleset[rule['ruleset']].append(rule)
+
         result = {}
         for pool_id, pool in self.pools_by_id.items():
             osds = None
-            for rule in [r for r in self.data['crush']['rules'] if r['ruleset'] == pool['crush_ruleset']]:
+            for rule in rules_by_ruleset.get(pool['crush_ruleset'], []):
                 if rule['min_size'] <= pool['size'] <= rule['max_size']:
                     osds = self.osds_by_rule_id[rule['rule_id']]
 
@@ -183,7 +197,7 @@ class OsdMap(VersionedSyncObject):
         """
         A dict of OSD ID to list of pool IDs
         """
-        osds = dict([(osd_id, []) for osd_id in self.osds_by_id.keys()])
+        osds = {osd_id: [] for osd_id in self.osds_by_id}
         for pool_id in self.pools_by_id.keys():
             for in_pool_id in self.osds_by_pool[pool_id]:
                 osds[in_pool_id].append(pool_id)
@@ -244,6 +258,7 @@ USER_REQUEST_SUBMITTED = 'submitted'
 # List of allowable things to send as ceph commands to OSDs
 OSD_IMPLEMENTED_COMMANDS = ('scrub', 'deep_scrub', 'repair')
 OSD_FLAGS = ('pause', 'noup', 'nodown', 'noout', 'noin', 'nobackfill', 'norecover', 'noscrub', 'nodeep-scrub')
+OSD_FLAGS_SET = frozenset(OSD_FLAGS)
 
 # Severity codes for Calamari events
 CRITICAL = 1
@@ -94,7 +94,7 @@ class MgrClient(object):
         return sorted([self._dump_request(r)
                        for r in requests
                        if (state is None or r.state == state) and (fsid is None or r.fsid == fsid)],
-                      lambda a, b: cmp(b['requested_at'], a['requested_at']))
+                      key=lambda r: r['requested_at'], reverse=True)
 
     def _dump_request(self, request):
         """UserRequest to JSON-serializable form"""
@@ -130,18 +130,22 @@ class MgrClient(object):
         Get many objects
         """
 
-        osd_map = self.get_sync_object(OsdMap).data
+        sync_object = self.get_sync_object(OsdMap)
+        osd_map = sync_object.data
         if osd_map is None:
             return []
         if object_type == OSD:
             result = osd_map['osds']
+            # Filter with set membership: both the requested IDs and the pool's
+            # OSDs are lists, which would make these filters O(N*M).
             if 'id__in' in list_filter:
-                result = [o for o in result if o['osd'] in list_filter['id__in']]
+                ids = set(list_filter['id__in'])
+                result = [o for o in result if o['osd'] in ids]
             if 'pool' in list_filter:
                 try:
-                    osds_in_pool = self.get_sync_object(OsdMap).osds_by_pool[list_filter['pool']]
+                    osds_in_pool = set(sync_object.osds_by_pool[list_filter['pool']])
                 except KeyError:
-                    raise NotFound("Pool {0} does not exist".format(list_filter['pool']))
+                    raise NotFound(POOL, list_filter['pool'])
                 else:
                     result = [o for o in result if o['osd'] in osds_in_pool]
 
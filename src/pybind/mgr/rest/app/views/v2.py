@@ -14,7 +14,8 @@ from rest.app.serializers.v2 import PoolSerializer, CrushRuleSetSerializer, \
 from rest.app.views.rpc_view import RPCViewSet, DataObject
 from rest.app.types import CRUSH_RULE, POOL, OSD, USER_REQUEST_COMPLETE, \
     USER_REQUEST_SUBMITTED, OSD_IMPLEMENTED_COMMANDS, OSD_MAP, \
-    SYNC_OBJECT_TYPES, OsdMap, Config, MonMap, MonStatus, SYNC_OBJECT_STR_TYPE
+    SYNC_OBJECT_TYPES, OsdMap, Config, MonMap, MonStatus, SYNC_OBJECT_STR_TYPE, \
+    NotFound
 
 
 from rest.logger import logger
@@ -70,7 +71,8 @@ together to a pool.
     serializer_class = CrushRuleSerializer
 
     def list(self, request):
-        rules = self.client.list(CRUSH_RULE, {})
+        # Copy the rules before decorating them, they belong to the cached OsdMap
+        rules = [dict(r) for r in self.client.list(CRUSH_RULE, {})]
         osds_by_rule_id = self.client.get_sync_object(OsdMap, ['osds_by_rule_id'])
         for rule in rules:
             rule['osd_count'] = len(osds_by_rule_id[rule['rule_id']])
@@ -84,7 +86,7 @@ A CRUSH rule is used by Ceph to decide where to locate placement groups on OSDs.
     serializer_class = CrushRuleSetSerializer
 
     def list(self, request):
-        rules = self.client.list(CRUSH_RULE, {})
+        rules = [dict(r) for r in self.client.list(CRUSH_RULE, {})]
         osds_by_rule_id = self.client.get_sync_object(OsdMap, ['osds_by_rule_id'])
         rulesets_data = defaultdict(list)
         for rule in rules:
@@ -300,7 +302,7 @@ but those without static defaults will be set to null.
             errors['pgp_num'].append('must be >= to pg_num')
 
     def _check_name_unique(self, data, errors):
-        if 'name' in data and data['name'] in [x.pool_name for x in [PoolDataObject(p) for p in self.client.list(POOL, {})]]:
+        if 'name' in data and any(p['pool_name'] == data['name'] for p in self.client.list(POOL, {})):
             errors['name'].append('Pool with name {name} already exists'.format(name=data['name']))
 
 
@@ -349,20 +351,19 @@ Filtering is available on this resource:
             except ValueError:
                 return Response("Invalid OSD ID in list", status=status.HTTP_400_BAD_REQUEST)
 
-        # Get data
-        osds = self.client.list(OSD, list_filter)
-        osd_to_pools = self.client.get_sync_object(OsdMap, ['osd_pools'])
-        crush_nodes = self.client.get_sync_object(OsdMap, ['osd_tree_node_by_id'])
-        osd_metadata = self.client.get_sync_object(OsdMap, ['osd_metadata'])
-
-        osd_id_to_hostname = dict(
-            [(int(osd_id), osd_meta["hostname"]) for osd_id, osd_meta in
-             osd_metadata.items()])
+        # Get data, copying the OSDs because we decorate them below and
+        # they belong to the cached OsdMap
+        osds = [dict(o) for o in self.client.list(OSD, list_filter)]
+        osd_map = self.client.get_sync_object(OsdMap)
+        osd_to_pools = osd_map.osd_pools
+        crush_nodes = osd_map.osd_tree_node_by_id
+        osd_metadata = osd_map.osd_metadata
 
         # Get data depending on OSD list
         osd_commands = self.client.get_valid_commands(OSD, [x['osd'] for x in osds])
 
-        # Build OSD data objects
+        # Build OSD data objects.  The list has already been filtered, so
+        # only look up what we need for the OSDs we are returning.
         for o in osds:
             # An OSD being in the OSD map does not guarantee its presence in the CRUSH
             # map, as "osd crush rm" and "osd rm" are separate operations.
@@ -372,31 +373,28 @@ Filtering is available on this resource:
                 log.warning("No CRUSH data available for OSD {0}".format(o['osd']))
                 o.update({'reweight': 0.0})
 
-            o['server'] = osd_id_to_hostname.get(o['osd'], None)
-
-        for o in osds:
+            osd_meta = osd_metadata.get(str(o['osd']))
+            o['server'] = osd_meta["hostname"] if osd_meta is not None else None
             o['pools'] = osd_to_pools[o['osd']]
-
-        for o in osds:
             o.update(osd_commands[o['osd']])
 
         return Response(self.serializer_class([DataObject(o) for o in osds], many=True).data)
 
     def retrieve(self, request, osd_id):
-        osd = self.client.get_sync_object(OsdMap, ['osds_by_id', int(osd_id)])
-        crush_node = self.client.get_sync_object(OsdMap, ['osd_tree_node_by_id', int(osd_id)])
+        osd_map = self.client.get_sync_object(OsdMap)
+        try:
+            osd = dict(osd_map.osds_by_id[int(osd_id)])
+            crush_node = osd_map.osd_tree_node_by_id[int(osd_id)]
+        except KeyError:
+            raise NotFound(OSD, osd_id)
         osd['reweight'] = float(crush_node['reweight'])
 
-        osd_metadata = self.client.get_sync_object(OsdMap, ['osd_metadata'])
+        # Only one OSD's hostname is needed, so look it up directly rather
+        # than building the id->hostname map for the whole cluster
+        osd_meta = osd_map.osd_metadata.get(str(osd['osd']))
+        osd['server'] = osd_meta["hostname"] if osd_meta is not None else None
 
-        osd_id_to_hostname = dict(
-            [(int(oid), osd_meta["hostname"]) for oid, osd_meta in
-             osd_metadata.items()])
-
-        osd['server'] = osd_id_to_hostname.get(osd['osd'], None)
-
-        pools = self.client.get_sync_object(OsdMap, ['osd_pools', int(osd_id)])
-        osd['pools'] = pools
+        osd['pools'] = osd_map.osd_pools[int(osd_id)]
 
         osd_commands = self.client.get_valid_commands(OSD, [int(osd_id)])
         osd.update(osd_commands[int(osd_id)])
@@ -523,9 +521,8 @@ useful to show users data from the /status sub-url, which returns the
 
     def retrieve(self, request, mon_id):
         mons = self._get_mons()
-        try:
-            mon = [m for m in mons if m['name'] == mon_id][0]
-        except IndexError:
+        mon = next((m for m in mons if m['name'] == mon_id), None)
+        if mon is None:
             raise Http404("Mon '%s' not found" % mon_id)
 
         return Response(self.serializer_class(DataObject(mon)).data)
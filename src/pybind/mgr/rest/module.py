@@ -14,15 +14,11 @@ def global_instance():
 
 import os
 import logging
-import logging.config
 import json
 import uuid
 import errno
 import sys
 
-import cherrypy
-from django.core.servers.basehttp import get_internal_wsgi_application
-
 from mgr_module import MgrModule
 
 from rest.app.manager.request_collection import RequestCollection
@@ -83,6 +79,9 @@ class Module(MgrModule):
             __name__, _global_instance))
         self.requests = RequestCollection()
 
+        # The last OsdMap we built, reused while the epoch is unchanged
+        self._osd_map = None
+
         self.keys = {}
         self.enable_auth = True
 
@@ -90,7 +89,7 @@ class Module(MgrModule):
         # FIXME: don't bother going and get_sync_object'ing the map
         # unless there is actually someone waiting for it (find out inside
         # requests.on_map)
-        self.log.info("Notify {0}".format(notify_type))
+        self.log.debug("Notify %s", notify_type)
         if notify_type == "command":
             self.requests.on_completion(notify_id)
         elif notify_type == "osd_map":
@@ -108,11 +107,20 @@ class Module(MgrModule):
 
             assert data is not None
 
-            data['tree'] = self.get("osd_map_tree")
-            data['crush'] = self.get("osd_map_crush")
-            data['crush_map_text'] = self.get("osd_map_crush_map_text")
-            data['osd_metadata'] = self.get("osd_metadata")
-            obj = OsdMap(data['epoch'], data)
+            # Tree and CRUSH changes always come with a new epoch, so
+            # while it is unchanged we can keep the OsdMap we already built
+            # along with its memoized CRUSH calculations.  Metadata is
+            # not versioned by the epoch and is always refreshed.
+            obj = self._osd_map
+            if obj is not None and obj.version == data['epoch']:
+                obj.data['osd_metadata'] = self.get("osd_metadata")
+            else:
+                data['tree'] = self.get("osd_map_tree")
+                data['crush'] = self.get("osd_map_crush")
+                data['crush_map_text'] = self.get("osd_map_crush_map_text")
+                data['osd_metadata'] = self.get("osd_metadata")
+                obj = OsdMap(data['epoch'], data)
+                self._osd_map = obj
         elif object_type == Config:
             data = self.get("config")
             obj = Config(0, data)
@@ -124,7 +132,6 @@ class Module(MgrModule):
             obj = FsMap(data['epoch'], data)
         elif object_type == PgSummary:
             data = self.get("pg_summary")
-            self.log.debug("JSON: {0}".format(data))
             obj = PgSummary(0, data)
         elif object_type == Health:
             data = self.get("health")
@@ -156,6 +163,7 @@ class Module(MgrModule):
         return [self._auth_cls()]
 
     def shutdown(self):
+        import cherrypy
         cherrypy.engine.stop()
 
     def serve(self):
@@ -164,6 +172,11 @@ class Module(MgrModule):
         if self.enable_auth is None:
             self.enable_auth = True
 
+        # The web server and Django are only needed once we start serving,
+        # so don't pay for importing them when the module is loaded
+        import cherrypy
+        from django.core.servers.basehttp import get_internal_wsgi_application
+
         app = get_internal_wsgi_application()
 
         from rest_framework import authentication